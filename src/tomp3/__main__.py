@@ -1,14 +1,18 @@
 import logging
-import subprocess
 import time
 from pathlib import Path
-from typing import Callable, Generator
+from typing import Callable, Iterable, Iterator
 
 from tomp3.args import Args, parse_args
+from tomp3.encoder import FakeEncoder, FFmpegEncoder, LameEncoder
+from tomp3.encoder.encoder_protocol import EncoderProtocol
+from tomp3.encoder.ffmpeg_encoder import build_ffmpeg_args
+from tomp3.file_status import FileStatus
+from tomp3.job_table import JobTable
 from tomp3.log_config import setup_logger
 from tomp3.path_resolver import OutputPathResolver
+from tomp3.plan import build_plan, load_plan, planned_output_paths, write_plan
 from tomp3.ui import ConversionUI
-from tomp3.ui.file_status import FileStatus
 from tomp3.ui.null_ui import NullUI
 from tomp3.ui.ui_protocol import TUIProtocol
 
@@ -17,53 +21,75 @@ def main() -> None:
     args = parse_args()
     logger = setup_logger(dry_run=args.dry_run)
 
-    if args.input_dir.exists() and args.input_dir.is_dir():
+    if args.from_plan:
+        jobs, outputs = load_plan(args.from_plan)
+        convert_jobs(args, jobs, planned_output_paths(outputs, args.dry_run), logger)
+    elif args.input_dir and args.input_dir.exists() and args.input_dir.is_dir():
         path_resolver = OutputPathResolver(
             args.input_dir,
             args.output_dir,
-            args.dry_run
+            args.dry_run or args.plan
         )
-        handle_directory(args, path_resolver, logger)
+        handle_directory(args, args.input_dir, path_resolver, logger)
     else:
         raise ValueError("Please provide a valid directory.")
 
 
 def handle_directory(
         args: Args,
+        input_dir: Path,
         path_resolver: OutputPathResolver,
         logger: logging.Logger
     ) -> None:
-    fpaths = get_files_to_convert(args.input_dir, args.target_extensions, logger)
-    output_fpaths = (path_resolver.resolve(fpath) for fpath in fpaths)
+    jobs = get_files_to_convert(input_dir, args.target_extensions, logger)
+    output_fpaths = (path_resolver.resolve(jobs.path(i)) for i in jobs.ids())
+
+    if args.plan:
+        encoder = initialize_encoder(args)
+        plan = build_plan(
+            jobs,
+            output_fpaths,
+            encoder,
+            input_dir,
+            args
+        )
+        encoder.close()
+        write_plan(plan)
+        return
 
-    if dry_run(args, fpaths, output_fpaths, logger):
+    convert_jobs(args, jobs, output_fpaths, logger)
+
+
+def convert_jobs(
+        args: Args,
+        jobs: JobTable,
+        output_fpaths: Iterable[Path],
+        logger: logging.Logger
+    ) -> None:
+    if dry_run(args, jobs, output_fpaths, logger):
         return
 
-    tui: TUIProtocol = initialize_ui(args) if args.tui else NullUI()
-    tui.set_file_list(fpaths)
+    encoder = initialize_encoder(args)
 
-    ffmpeg_args = build_ffmpeg_args(args)
-    running_processes: dict[subprocess.Popen[bytes], Path] = {}
+    tui: TUIProtocol = initialize_ui(args) if args.tui else NullUI()
+    tui.set_job_table(jobs)
 
     def cleanup() -> None:
-        cleanup_finished_processes(running_processes, tui, args)
+        cleanup_finished_jobs(encoder, jobs, tui, args)
 
-    for ifpath, ofpath in zip(fpaths, output_fpaths):
-        while len(running_processes) >= args.max_workers:
+    for job_id, ofpath in zip(jobs.ids(), output_fpaths):
+        while encoder.running() >= args.max_workers:
             cleanup()
             time.sleep(0.1)
 
-        if should_skip_conversion(ofpath, args, tui, logger, ifpath):
+        if should_skip_conversion(ofpath, args, jobs, tui, logger, job_id):
             continue
 
-        cmd = ["ffmpeg", "-i", str(ifpath), *ffmpeg_args, str(ofpath)]
-        logger.debug(f"Running command: {' '.join(cmd)}")
-
-        process = start_conversion_process(cmd)
-        running_processes[process] = ifpath
-        tui.update_file_status(ifpath, FileStatus.CONVERTING)
+        encoder.submit(job_id, jobs.path(job_id), ofpath)
+        update_job_status(jobs, tui, job_id, FileStatus.CONVERTING)
 
-    wait_for_all_processes(running_processes, cleanup)
+    wait_for_all_jobs(encoder, cleanup)
+    encoder.close()
 
     tui.force_update()
     time.sleep(0.5)
@@ -72,13 +98,13 @@ def handle_directory(
 
 def dry_run(
         args: Args,
-        fpaths: list[Path],
-        output_fpaths: Generator[Path],
+        jobs: JobTable,
+        output_fpaths: Iterable[Path],
         logger: logging.Logger
     ) -> bool:
     if args.dry_run:
-        for ifpath, ofpath in zip(fpaths, output_fpaths):
-            logger.info(f"Would convert: {ifpath} -> {ofpath}")
+        for job_id, ofpath in zip(jobs.ids(), output_fpaths):
+            logger.info(f"Would convert: {jobs.path(job_id)} -> {ofpath}")
         return True
     return False
 
@@ -87,93 +113,82 @@ def initialize_ui(args: Args) -> ConversionUI:
     return ConversionUI(visible_files=max(20, args.max_workers + 5))
 
 
+def initialize_encoder(args: Args) -> EncoderProtocol:
+    match args.encoder:
+        case "lame":
+            return LameEncoder(args)
+        case "fake":
+            return FakeEncoder()
+        case _:
+            return FFmpegEncoder(build_ffmpeg_args(args))
+
+
 def get_files_to_convert(
         input_dir: Path,
         extensions: set[str],
         logger: logging.Logger
-    ) -> list[Path]:
-    fpaths = scan_directory(input_dir, extensions)
-    logger.info(f"Found {len(fpaths)} files to convert in '{input_dir}'.")
-    return fpaths
+    ) -> JobTable:
+    jobs = JobTable(scan_directory(input_dir, extensions))
+    logger.info(f"Found {len(jobs)} files to convert in '{input_dir}'.")
+    return jobs
 
 
-def scan_directory(directory: Path, extensions: set[str]) -> list[Path]:
-    return [
+def scan_directory(directory: Path, extensions: set[str]) -> Iterator[Path]:
+    return (
         f.resolve()
         for f in directory.rglob("*")
         if f.is_file() and f.suffix.lower() in extensions
-    ]
+    )
 
 
-def build_ffmpeg_args(
-        args: Args,
-    ) -> list[str]:
-    cmd = [
-        "-acodec", "libmp3lame",
-        "-ar", str(args.sample_rate) if args.sample_rate else "44100",
-        "-ac", "1" if args.mono else "2",
-    ]
-
-    if args.bitrate:
-        cmd += ["-b:a", str(args.bitrate)]
-    if args.quality:
-        cmd += ["-q:a", str(args.quality)]
-    if args.overwrite:
-        cmd.append("-y")
-    
-    return cmd
-
-
-def cleanup_finished_processes(
-    running_processes: dict[subprocess.Popen[bytes], Path],
+def cleanup_finished_jobs(
+    encoder: EncoderProtocol,
+    jobs: JobTable,
     tui: TUIProtocol,
     args: Args
 ) -> None:
-    for process in list(running_processes):
-        if process.poll() is None:
-            continue
-
-        success = process.returncode == 0
-        fpath = running_processes.pop(process)
-
-        tui.update_file_status(
-            fpath, FileStatus.CONVERTED if success else FileStatus.ERROR
+    for job_id, success in encoder.poll():
+        update_job_status(
+            jobs, tui, job_id, FileStatus.CONVERTED if success else FileStatus.ERROR
         )
 
         if success and args.delete:
-            fpath.unlink()
+            jobs.path(job_id).unlink()
 
 
 def should_skip_conversion(
         output_path: Path,
         args: Args,
+        jobs: JobTable,
         tui: TUIProtocol,
         logger: logging.Logger,
-        fpath: Path
+        job_id: int
     ) -> bool:
     if output_path.exists() and not args.overwrite:
-        tui.update_file_status(fpath, FileStatus.CONVERTED)
+        update_job_status(jobs, tui, job_id, FileStatus.CONVERTED)
+        fpath = jobs.path(job_id)
         logger.info(f"Skipping: {fpath} -> {output_path} as it already exists.")
         return True
     return False
 
 
-def start_conversion_process(cmd: list[str]) -> subprocess.Popen[bytes]:
-    return subprocess.Popen(
-        cmd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        start_new_session=True
-    )
+def update_job_status(
+        jobs: JobTable,
+        tui: TUIProtocol,
+        job_id: int,
+        status: FileStatus
+    ) -> None:
+    jobs.set_status(job_id, status)
+    tui.update_file_status(job_id)
 
 
-def wait_for_all_processes(
-    running_processes: dict[subprocess.Popen[bytes], Path],
+def wait_for_all_jobs(
+    encoder: EncoderProtocol,
     cleanup_fn: Callable[[], None]
 ) -> None:
-    for process in list(running_processes):
-        process.wait()
+    while encoder.running():
         cleanup_fn()
+        time.sleep(0.1)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,26 @@
 import argparse
+import importlib.util
+import json
 import multiprocessing
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from tomp3 import __version__
 
+# Options that plans record, with their defaults. --from-plan reuses the
+# recorded values, so these cannot be passed alongside it.
+PLAN_SETTINGS: dict[str, Any] = {
+    "encoder": "ffmpeg",
+    "bitrate": None,
+    "quality": 0,
+    "mono": False,
+    "sample_rate": 44100,
+    "overwrite": False,
+}
+
 
 class Args(NamedTuple):
-    input_dir: Path
+    input_dir: Path | None
     output_dir: Path | None
     delete: bool
     target_extensions: set[str]
@@ -19,6 +32,9 @@ class Args(NamedTuple):
     sample_rate: int
     overwrite: bool
     tui: bool
+    plan: bool
+    from_plan: Path | None
+    encoder: str
 
 
 def parse_args() -> Args:
@@ -31,7 +47,8 @@ def parse_args() -> Args:
     parser.add_argument(
         "input",
         type=Path,
-        help="Input directory to convert"
+        nargs="?",
+        help="Input directory to convert (optional with --from-plan)"
     )
 
     parser.add_argument(
@@ -50,8 +67,8 @@ def parse_args() -> Args:
     parser.add_argument(
         "--target-extensions",
         type=str,
-        default="flac,wav",
-        help="Comma-separated list of file extensions to convert (default: flac,wav)"
+        help="Comma-separated list of file extensions to convert "
+             "(default: flac,wav, or wav with --encoder lame)"
     )
 
     processes_default = max(1, multiprocessing.cpu_count() // 2)
@@ -59,7 +76,15 @@ def parse_args() -> Args:
         "--max-workers",
         type=int,
         default=processes_default,
-        help=f"Number of ffmpeg processes to start (default: {processes_default})"
+        help=f"Number of files to convert in parallel (default: {processes_default})"
+    )
+
+    parser.add_argument(
+        "--encoder",
+        choices=["ffmpeg", "lame", "fake"],
+        help="Encoder backend: ffmpeg subprocesses, in-process LAME for 16-bit "
+             "WAV files (requires lameenc), or a fake encoder that writes "
+             "nothing, for testing (default: ffmpeg)"
     )
 
     parser.add_argument(
@@ -68,23 +93,36 @@ def parse_args() -> Args:
         help="Show what would be converted without actually converting"
     )
 
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print a JSON conversion plan with file counts, audio duration, "
+             "expected output size and an estimated run time, then exit"
+    )
+
+    parser.add_argument(
+        "--from-plan",
+        type=Path,
+        help="Convert the jobs listed in a plan produced by --plan "
+             "instead of scanning the input directory"
+    )
+
     parser.add_argument(
         "--mono",
         action="store_true",
+        default=None,
         help="Convert to mono audio (default: stereo)"
     )
 
     parser.add_argument(
         "--quality",
         type=int,
-        default=0,
         help="Quality setting for LAME (0-9, where 0 is best quality, default: 0)"
     )
     
     parser.add_argument(
         "--sample-rate",
         type=int,
-        default=44100,
         help="Sample rate for output audio (default: 44100)"
     )
 
@@ -97,6 +135,7 @@ def parse_args() -> Args:
     parser.add_argument(
         "--overwrite",
         action="store_true",
+        default=None,
         help="Overwrite existing files"
     )
 
@@ -114,12 +153,54 @@ def parse_args() -> Args:
 
     args = parser.parse_args()
 
+    if not args.input and not args.from_plan:
+        parser.error("the following arguments are required: input")
+
+    if args.from_plan:
+        args.from_plan = args.from_plan.expanduser().resolve()
+        if args.plan:
+            parser.error("--plan cannot be used with --from-plan")
+        if args.input:
+            parser.error("input cannot be used with --from-plan")
+        if args.output_dir:
+            parser.error("--output-dir cannot be used with --from-plan")
+        if args.target_extensions:
+            parser.error("--target-extensions cannot be used with --from-plan")
+        for name in PLAN_SETTINGS:
+            if getattr(args, name) is not None:
+                option = "--" + name.replace("_", "-")
+                parser.error(f"{option} cannot be used with --from-plan")
+        _apply_plan_settings(parser, args)
+
+    for name, default in PLAN_SETTINGS.items():
+        if getattr(args, name) is None:
+            setattr(args, name, default)
+
+    default_extensions = "wav" if args.encoder == "lame" else "flac,wav"
+
     target_extensions = {
         f".{ext.strip().lower()}" 
-        for ext in args.target_extensions.split(",")
+        for ext in (args.target_extensions or default_extensions).split(",")
     }
 
-    args.input = args.input.expanduser().resolve()
+    if args.encoder == "fake" and args.delete:
+        parser.error("--delete cannot be used with --encoder fake")
+    if args.encoder == "fake" and args.plan:
+        parser.error("--plan cannot be used with --encoder fake")
+
+    if args.encoder == "lame":
+        if importlib.util.find_spec("lameenc") is None:
+            parser.error("--encoder lame requires lameenc: pip install 'tomp3[lame]'")
+        if target_extensions - {".wav"}:
+            parser.error("--encoder lame only supports .wav files")
+        if args.bitrate:
+            try:
+                parse_bitrate_kbps(args.bitrate)
+            except ValueError:
+                parser.error(f"invalid --bitrate for --encoder lame: {args.bitrate}")
+
+    if args.input:
+        args.input = args.input.expanduser().resolve()
     if args.output_dir:
         args.output_dir = args.output_dir.expanduser().resolve()
 
@@ -135,5 +216,33 @@ def parse_args() -> Args:
         quality=args.quality,
         sample_rate=args.sample_rate,
         overwrite=args.overwrite,
-        tui=not args.no_ui
+        tui=not args.no_ui,
+        plan=args.plan,
+        from_plan=args.from_plan,
+        encoder=args.encoder
     )
+
+
+def parse_bitrate_kbps(bitrate: str) -> int:
+    value = bitrate.strip().lower()
+    kbps = int(value[:-1]) if value.endswith("k") else int(value) // 1000
+    if kbps <= 0:
+        raise ValueError(f"Bitrate must be positive: {bitrate}")
+    return kbps
+
+
+def _apply_plan_settings(
+        parser: argparse.ArgumentParser,
+        args: argparse.Namespace
+    ) -> None:
+    try:
+        with args.from_plan.open() as f:
+            settings = json.load(f).get("settings")
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read plan {args.from_plan}: {e}")
+
+    if not isinstance(settings, dict) or set(settings) != set(PLAN_SETTINGS):
+        parser.error(f"{args.from_plan} has no conversion settings; re-run --plan")
+
+    for name, value in settings.items():
+        setattr(args, name, value)
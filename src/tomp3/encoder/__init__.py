@@ -0,0 +1,5 @@
+from .fake_encoder import FakeEncoder
+from .ffmpeg_encoder import FFmpegEncoder
+from .lame_encoder import LameEncoder
+
+__all__ = ["FakeEncoder", "FFmpegEncoder", "LameEncoder"]
\ No newline at end of file
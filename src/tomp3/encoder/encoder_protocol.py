@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Optional, Protocol
+
+
+class EncoderProtocol(Protocol):
+    def submit(
+            self,
+            job_id: int,
+            input_path: Path,
+            output_path: Path,
+            max_seconds: Optional[float] = None
+        ) -> None:
+        """Start converting a file, or only its first ``max_seconds`` of audio."""
+        pass
+
+    def poll(self) -> list[tuple[int, bool]]:
+        """Return the jobs that finished since the last poll and their success."""
+        pass
+
+    def running(self) -> int:
+        """Return the number of jobs that have not finished yet."""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the encoder."""
+        pass
\ No newline at end of file
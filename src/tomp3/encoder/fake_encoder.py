@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Optional
+
+from .encoder_protocol import EncoderProtocol
+
+
+class FakeEncoder(EncoderProtocol):
+    """Encoder that never touches the filesystem.
+
+    Every job finishes after ``polls_per_job`` calls to :meth:`poll`, and every
+    ``fail_every``-th job ID fails, so runs are fully deterministic.
+    """
+
+    def __init__(self, polls_per_job: int = 1, fail_every: int = 0) -> None:
+        self._polls_per_job = polls_per_job
+        self._fail_every = fail_every
+        self._pending: dict[int, int] = {}
+
+    def submit(
+            self,
+            job_id: int,
+            input_path: Path,
+            output_path: Path,
+            max_seconds: Optional[float] = None
+        ) -> None:
+        self._pending[job_id] = self._polls_per_job
+
+    def poll(self) -> list[tuple[int, bool]]:
+        finished = []
+        for job_id in list(self._pending):
+            self._pending[job_id] -= 1
+            if self._pending[job_id] > 0:
+                continue
+
+            del self._pending[job_id]
+            failed = self._fail_every and (job_id + 1) % self._fail_every == 0
+            finished.append((job_id, not failed))
+        return finished
+
+    def running(self) -> int:
+        return len(self._pending)
+
+    def close(self) -> None:
+        self._pending.clear()
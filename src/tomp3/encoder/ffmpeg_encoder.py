@@ -0,0 +1,78 @@
+import logging
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from tomp3.args import Args
+
+from .encoder_protocol import EncoderProtocol
+
+logger = logging.getLogger("tomp3")
+
+
+class FFmpegEncoder(EncoderProtocol):
+    def __init__(self, ffmpeg_args: list[str]) -> None:
+        self._ffmpeg_args = ffmpeg_args
+        self._running_processes: dict[subprocess.Popen[bytes], int] = {}
+
+    def submit(
+            self,
+            job_id: int,
+            input_path: Path,
+            output_path: Path,
+            max_seconds: Optional[float] = None
+        ) -> None:
+        limit = ["-t", str(max_seconds)] if max_seconds else []
+        cmd = [
+            "ffmpeg", *limit, "-i", str(input_path),
+            *self._ffmpeg_args, str(output_path)
+        ]
+        logger.debug(f"Running command: {' '.join(cmd)}")
+
+        process = start_conversion_process(cmd)
+        self._running_processes[process] = job_id
+
+    def poll(self) -> list[tuple[int, bool]]:
+        finished = []
+        for process in list(self._running_processes):
+            if process.poll() is None:
+                continue
+
+            job_id = self._running_processes.pop(process)
+            finished.append((job_id, process.returncode == 0))
+        return finished
+
+    def running(self) -> int:
+        return len(self._running_processes)
+
+    def close(self) -> None:
+        for process in self._running_processes:
+            process.wait()
+
+
+def build_ffmpeg_args(
+        args: Args,
+    ) -> list[str]:
+    cmd = [
+        "-acodec", "libmp3lame",
+        "-ar", str(args.sample_rate) if args.sample_rate else "44100",
+        "-ac", "1" if args.mono else "2",
+    ]
+
+    if args.bitrate:
+        cmd += ["-b:a", str(args.bitrate)]
+    if args.quality:
+        cmd += ["-q:a", str(args.quality)]
+    if args.overwrite:
+        cmd.append("-y")
+    
+    return cmd
+
+
+def start_conversion_process(cmd: list[str]) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
@@ -0,0 +1,67 @@
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from tomp3.file_status import FileStatus
+
+_STATUS_BY_VALUE = {status.value: status for status in FileStatus}
+
+
+class JobTable:
+    """Array-backed table of conversion jobs addressed by integer job IDs.
+
+    Paths are stored as interned strings and every other column lives in a
+    compact ``array``, so tracking millions of files does not require one
+    ``Path`` object (and its hash) per file in every structure.
+    """
+
+    __slots__ = ("_paths", "_sizes", "_statuses")
+
+    def __init__(self, fpaths: Iterable[Path] = ()) -> None:
+        self._paths: list[str] = []
+        self._sizes = array("q")
+        self._statuses = array("B")
+
+        for fpath in fpaths:
+            self.add(fpath)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def add(self, fpath: Path, size: int | None = None) -> int:
+        self._paths.append(sys.intern(str(fpath)))
+        self._sizes.append(fpath.stat().st_size if size is None else size)
+        self._statuses.append(FileStatus.WAITING.value)
+        return len(self._paths) - 1
+
+    def ids(self) -> range:
+        return range(len(self._paths))
+
+    def path(self, job_id: int) -> Path:
+        self.check_job_id(job_id)
+        return Path(self._paths[job_id])
+
+    def name(self, job_id: int) -> str:
+        self.check_job_id(job_id)
+        return os.path.basename(self._paths[job_id])
+
+    def size(self, job_id: int) -> int:
+        self.check_job_id(job_id)
+        return self._sizes[job_id]
+
+    def total_size(self) -> int:
+        return sum(self._sizes)
+
+    def status(self, job_id: int) -> FileStatus:
+        self.check_job_id(job_id)
+        return _STATUS_BY_VALUE[self._statuses[job_id]]
+
+    def set_status(self, job_id: int, status: FileStatus) -> None:
+        self.check_job_id(job_id)
+        self._statuses[job_id] = status.value
+
+    def check_job_id(self, job_id: int) -> None:
+        if not 0 <= job_id < len(self._paths):
+            raise ValueError(f"Job {job_id} not found in the job table.")
@@ -0,0 +1,243 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, TextIO
+
+from tomp3.args import PLAN_SETTINGS, Args
+from tomp3.encoder.encoder_protocol import EncoderProtocol
+from tomp3.job_table import JobTable
+
+PLAN_VERSION = 2
+CALIBRATION_SECONDS = 30.0
+SHORT_CALIBRATION_SECONDS = 1.0
+MIN_CALIBRATION_SPREAD = 1.0
+CALIBRATION_JOB_ID = -1
+
+
+class Calibration(NamedTuple):
+    fpath: Path
+    audio_seconds: float
+    wall_seconds: float
+    output_bytes: int
+    seconds_per_audio_second: float
+    seconds_per_file: float
+
+    @property
+    def output_bytes_per_second(self) -> float:
+        return self.output_bytes / self.audio_seconds
+
+
+def build_plan(
+        jobs: JobTable,
+        output_fpaths: Iterable[Path],
+        encoder: EncoderProtocol,
+        input_dir: Path,
+        args: Args
+    ) -> dict[str, Any]:
+    outputs = list(output_fpaths)
+    durations = probe_durations(jobs, args.max_workers)
+    pending = [
+        job_id for job_id in jobs.ids()
+        if args.overwrite or not outputs[job_id].exists()
+    ]
+    audio_seconds = sum(durations[job_id] for job_id in pending)
+
+    calibration = calibrate(encoder, jobs, durations, pending)
+
+    # Calibration times a single encode, so running more workers than there
+    # are CPUs is not assumed to be any faster.
+    cpu_count = os.cpu_count() or 1
+    workers = max(1, min(args.max_workers, len(pending), cpu_count))
+
+    expected_output_bytes = None
+    estimated_seconds = None
+    if calibration:
+        expected_output_bytes = round(
+            audio_seconds * calibration.output_bytes_per_second
+        )
+        busy_seconds = (
+            len(pending) * calibration.seconds_per_file
+            + audio_seconds * calibration.seconds_per_audio_second
+        )
+        estimated_seconds = busy_seconds / workers
+
+    return {
+        "version": PLAN_VERSION,
+        "input_dir": str(input_dir),
+        "output_dir": str(args.output_dir) if args.output_dir else None,
+        "settings": {name: getattr(args, name) for name in PLAN_SETTINGS},
+        "max_workers": args.max_workers,
+        "cpu_count": cpu_count,
+        "effective_workers": workers,
+        "files": {
+            "total": len(jobs),
+            "to_convert": len(pending),
+            "skipped": len(jobs) - len(pending),
+            "unknown_duration": sum(1 for job_id in pending if not durations[job_id]),
+        },
+        "input_bytes": sum(jobs.size(job_id) for job_id in pending),
+        "audio_seconds": audio_seconds,
+        "expected_output_bytes": expected_output_bytes,
+        "estimated_seconds": estimated_seconds,
+        "calibration": _calibration_to_dict(calibration),
+        "jobs": [
+            {
+                "input": str(jobs.path(job_id)),
+                "output": str(outputs[job_id]),
+                "size": jobs.size(job_id),
+                "duration": durations[job_id],
+            }
+            for job_id in jobs.ids()
+        ],
+    }
+
+
+def write_plan(plan: dict[str, Any], stream: TextIO = sys.stdout) -> None:
+    json.dump(plan, stream, indent=2)
+    stream.write("\n")
+
+
+def load_plan(plan_file: Path) -> tuple[JobTable, list[Path]]:
+    with plan_file.open() as f:
+        plan = json.load(f)
+
+    if plan.get("version") != PLAN_VERSION:
+        raise ValueError(f"Unsupported plan version in {plan_file}.")
+
+    jobs = JobTable()
+    outputs = []
+    for job in plan["jobs"]:
+        jobs.add(Path(job["input"]), size=job["size"])
+        outputs.append(Path(job["output"]))
+    return jobs, outputs
+
+
+def planned_output_paths(outputs: list[Path], dry_run: bool) -> Iterator[Path]:
+    for output_path in outputs:
+        if not dry_run:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        yield output_path
+
+
+def probe_durations(jobs: JobTable, max_workers: int) -> list[float]:
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(probe_duration, map(jobs.path, jobs.ids())))
+
+
+def probe_duration(fpath: Path) -> float:
+    if fpath.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(fpath), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError):
+            pass
+
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        str(fpath)
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        return float(result.stdout.strip())
+    except (FileNotFoundError, ValueError):
+        return 0.0
+
+
+def calibrate(
+        encoder: EncoderProtocol,
+        jobs: JobTable,
+        durations: list[float],
+        pending: list[int]
+    ) -> Optional[Calibration]:
+    """Encode clips of the longest pending file to measure this host's speed.
+
+    A clip of up to ``CALIBRATION_SECONDS`` and one of
+    ``SHORT_CALIBRATION_SECONDS`` are timed, so the fixed per-file cost
+    (process start-up, probing) can be separated from the time spent per
+    second of audio. The short clip is encoded once beforehand to warm the
+    encoder up.
+    """
+    candidates = [job_id for job_id in pending if durations[job_id] > 0]
+    if not candidates:
+        return None
+
+    sample = max(candidates, key=lambda job_id: durations[job_id])
+    fpath = jobs.path(sample)
+    seconds = min(CALIBRATION_SECONDS, durations[sample])
+    short_seconds = min(SHORT_CALIBRATION_SECONDS, seconds)
+
+    with tempfile.TemporaryDirectory(prefix="tomp3-") as tmp:
+        warmup_out = Path(tmp) / "warmup.mp3"
+        if _timed_encode(encoder, fpath, warmup_out, short_seconds) is None:
+            return None
+
+        long_run = _timed_encode(encoder, fpath, Path(tmp) / "long.mp3", seconds)
+        if long_run is None:
+            return None
+        wall_seconds, output_bytes = long_run
+
+        seconds_per_audio_second = wall_seconds / seconds
+        seconds_per_file = 0.0
+        if seconds - short_seconds >= MIN_CALIBRATION_SPREAD:
+            short_out = Path(tmp) / "short.mp3"
+            short_run = _timed_encode(encoder, fpath, short_out, short_seconds)
+            if short_run is not None:
+                short_wall = short_run[0]
+                seconds_per_audio_second = max(
+                    0.0, (wall_seconds - short_wall) / (seconds - short_seconds)
+                )
+                seconds_per_file = max(
+                    0.0, short_wall - seconds_per_audio_second * short_seconds
+                )
+
+    return Calibration(
+        fpath=fpath,
+        audio_seconds=seconds,
+        wall_seconds=wall_seconds,
+        output_bytes=output_bytes,
+        seconds_per_audio_second=seconds_per_audio_second,
+        seconds_per_file=seconds_per_file
+    )
+
+
+def _timed_encode(
+        encoder: EncoderProtocol,
+        fpath: Path,
+        output_path: Path,
+        seconds: float
+    ) -> Optional[tuple[float, int]]:
+    start = time.perf_counter()
+    encoder.submit(CALIBRATION_JOB_ID, fpath, output_path, max_seconds=seconds)
+    finished: list[tuple[int, bool]] = []
+    while not finished:
+        time.sleep(0.01)
+        finished = encoder.poll()
+    elapsed = time.perf_counter() - start
+
+    success = finished[0][1]
+    if not success or not output_path.exists():
+        return None
+    return elapsed, output_path.stat().st_size
+
+
+def _calibration_to_dict(
+        calibration: Optional[Calibration]
+    ) -> Optional[dict[str, Any]]:
+    if calibration is None:
+        return None
+    return {
+        "file": str(calibration.fpath),
+        "audio_seconds": calibration.audio_seconds,
+        "wall_seconds": calibration.wall_seconds,
+        "output_bytes": calibration.output_bytes,
+        "seconds_per_audio_second": calibration.seconds_per_audio_second,
+        "seconds_per_file": calibration.seconds_per_file,
+    }
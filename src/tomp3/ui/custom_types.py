@@ -1,6 +1,4 @@
-from pathlib import Path
+from tomp3.file_status import FileStatus
 
-from .file_status import FileStatus
-
-FileListType = list[tuple[Path, FileStatus]]
-ReportType = dict[FileStatus, list[Path]]
\ No newline at end of file
+FileListType = list[tuple[int, FileStatus]]
+ReportType = dict[FileStatus, list[int]]
\ No newline at end of file
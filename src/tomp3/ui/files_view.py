@@ -1,52 +1,63 @@
 import threading
 from collections import OrderedDict, defaultdict
-from itertools import islice
-from pathlib import Path
+
+from tomp3.file_status import FileStatus
+from tomp3.job_table import JobTable
 
 from .custom_types import FileListType, ReportType
-from .file_status import FileStatus
 
 
 class FilesView:
     def __init__(self, visible: int) -> None:
         self._visible = visible
         self._lock = threading.Lock()
-        self._files: OrderedDict[Path, FileStatus] = OrderedDict()
-        self._total = 0
+        self._jobs = JobTable()
+        self._recent: OrderedDict[int, None] = OrderedDict()
         self._finished = 0
 
-    def set_files(self, files: list[Path]) -> None:
+    def set_jobs(self, jobs: JobTable) -> None:
         with self._lock:
-            self._files = OrderedDict((f, FileStatus.WAITING) for f in files)
-            self._total = len(files)
+            self._jobs = jobs
+            self._recent = OrderedDict()
             self._finished = 0
 
-    def update_file_status(self, fpath: Path, status: FileStatus) -> None:
+    def update_file_status(self, job_id: int) -> None:
         with self._lock:
-            if fpath not in self._files:
-                raise ValueError(f"File {fpath} not found in the list.")
-            
-            self._files[fpath] = status
-            self._files.move_to_end(fpath, last=False)
+            status = self._jobs.status(job_id)
+
+            self._recent[job_id] = None
+            self._recent.move_to_end(job_id, last=False)
+            if len(self._recent) > self._visible:
+                self._recent.popitem(last=True)
 
             if status in {FileStatus.CONVERTED, FileStatus.ERROR}:
                 self._finished += 1
 
     def get_visible(self) -> FileListType:
         with self._lock:
-            visible = list(islice(self._files.items(), self._visible))
+            visible = list(self._recent)
+            # Jobs that were never updated keep their original order after
+            # the recently updated ones, so fill the remaining rows from the
+            # start of the table.
+            for job_id in self._jobs.ids():
+                if len(visible) >= self._visible:
+                    break
+                if job_id not in self._recent:
+                    visible.append(job_id)
+
+            items = [(job_id, self._jobs.status(job_id)) for job_id in visible]
             return sorted(
-                visible,
+                items,
                 key=lambda x: 0 if x[1] == FileStatus.CONVERTING else 1
             )
 
     def get_status(self) -> tuple[int, int]:
         with self._lock:
-            return self._total, self._finished
+            return len(self._jobs), self._finished
 
     def get_report(self) -> ReportType:
         with self._lock:
             report = defaultdict(list)
-            for fpath, status in self._files.items():
-                report[status].append(fpath)
+            for job_id in self._jobs.ids():
+                report[self._jobs.status(job_id)].append(job_id)
             return dict(report)
\ No newline at end of file
@@ -1,18 +1,18 @@
-from pathlib import Path
 from typing import Optional
 
+from tomp3.job_table import JobTable
+
 from .custom_types import ReportType
-from .file_status import FileStatus
 from .ui_protocol import TUIProtocol
 
 
 class NullUI(TUIProtocol):
-    def set_file_list(self, file_list: list[Path]) -> None:
-        """Set the list of files to be converted."""
+    def set_job_table(self, jobs: JobTable) -> None:
+        """Set the table of jobs to be converted."""
         pass
 
-    def update_file_status(self, fpath: Path, status: FileStatus) -> None:
-        """Update the status of a file being converted."""
+    def update_file_status(self, job_id: int) -> None:
+        """Refresh a file whose status changed in the job table."""
         pass
 
     def stop(self) -> Optional[ReportType]:
@@ -1,32 +1,36 @@
 import threading
 import time
-from pathlib import Path
+
+from tomp3.job_table import JobTable
 
 
 class ProgressTracker:
     def __init__(self) -> None:
         self._initialized = False
-        self._file_sizes: dict[Path, int] = {}
+        self._jobs = JobTable()
+        self._done = bytearray()
         self._total_bytes = 0
         self._processed_bytes = 0
         self._start_time = 0.0
         self._lock = threading.Lock()
 
-    def start(self, files: list[Path]) -> None:
+    def start(self, jobs: JobTable) -> None:
         with self._lock:
-            self._file_sizes = {f: f.stat().st_size for f in files}
-            self._total_bytes = sum(self._file_sizes.values())
+            self._jobs = jobs
+            self._done = bytearray(len(jobs))
+            self._total_bytes = jobs.total_size()
             self._processed_bytes = 0
             self._start_time = time.time()
             self._initialized = True
 
-    def update_progress(self, fpath: Path) -> None:
+    def update_progress(self, job_id: int) -> None:
         with self._lock:
             self._check_initialized()
-            size = self._file_sizes.pop(fpath, None)
-            if size is None:
-                raise ValueError(f"File {fpath} not found in tracked files.")
-            self._processed_bytes += size
+            self._jobs.check_job_id(job_id)
+            if self._done[job_id]:
+                raise ValueError(f"Job {job_id} was already tracked.")
+            self._done[job_id] = 1
+            self._processed_bytes += self._jobs.size(job_id)
 
     def get_eta(self) -> float:
         with self._lock:
@@ -49,5 +53,5 @@ class ProgressTracker:
 
     def _check_initialized(self) -> None:
         if not self._initialized:
-            message = "ProgressTracker not initialized. Call start() with files first."
+            message = "ProgressTracker not initialized. Call start() with jobs first."
             raise RuntimeError(message)
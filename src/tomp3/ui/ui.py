@@ -1,7 +1,6 @@
 import shutil
 import threading
 import time
-from pathlib import Path
 from typing import Optional
 
 from rich import box
@@ -12,8 +11,10 @@ from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.text import Text
 
+from tomp3.file_status import FileStatus
+from tomp3.job_table import JobTable
+
 from .custom_types import ReportType
-from .file_status import FileStatus
 from .files_view import FilesView
 from .progress_tracker import ProgressTracker
 from .ui_protocol import TUIProtocol
@@ -21,6 +22,7 @@ from .ui_protocol import TUIProtocol
 
 class ConversionUI(TUIProtocol):
     def __init__(self, visible_files: int) -> None:
+        self._jobs = JobTable()
         self._files_view = FilesView(visible_files)
         self._progress_tracker = ProgressTracker()
         
@@ -37,15 +39,16 @@ class ConversionUI(TUIProtocol):
         self._live.stop()
         return self._files_view.get_report()
 
-    def set_file_list(self, fpaths: list[Path]) -> None:
-        self._files_view.set_files(fpaths)
-        self._progress_tracker.start(fpaths)
+    def set_job_table(self, jobs: JobTable) -> None:
+        self._jobs = jobs
+        self._files_view.set_jobs(jobs)
+        self._progress_tracker.start(jobs)
         self._mark_for_update()
 
-    def update_file_status(self, fpath: Path, status: FileStatus) -> None:
-        self._files_view.update_file_status(fpath, status)
-        if status in {FileStatus.CONVERTED, FileStatus.ERROR}:
-            self._progress_tracker.update_progress(fpath)
+    def update_file_status(self, job_id: int) -> None:
+        self._files_view.update_file_status(job_id)
+        if self._jobs.status(job_id) in {FileStatus.CONVERTED, FileStatus.ERROR}:
+            self._progress_tracker.update_progress(job_id)
         self._mark_for_update()
     
     def force_update(self) -> None:
@@ -71,15 +74,14 @@ class ConversionUI(TUIProtocol):
 
     def _render_view(self) -> Panel:
         items = [
-            self._build_file_item(fpath, status)
-            for fpath, status in self._files_view.get_visible()
+            self._build_file_item(self._jobs.name(job_id), status)
+            for job_id, status in self._files_view.get_visible()
         ]
         items.reverse()
         content = self._layout_items(items)
         return self._build_panel(content)
 
-    def _build_file_item(self, fpath: Path, status: FileStatus) -> Text | Spinner:
-        filename = fpath.name
+    def _build_file_item(self, filename: str, status: FileStatus) -> Text | Spinner:
         match status:
             case FileStatus.WAITING:
                 return Text(f"• {filename}", style="dim")
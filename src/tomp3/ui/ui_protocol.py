@@ -1,17 +1,17 @@
-from pathlib import Path
 from typing import Optional, Protocol
 
+from tomp3.job_table import JobTable
+
 from .custom_types import ReportType
-from .file_status import FileStatus
 
 
 class TUIProtocol(Protocol):
-    def set_file_list(self, file_list: list[Path]) -> None:
-        """Set the list of files to be converted."""
+    def set_job_table(self, jobs: JobTable) -> None:
+        """Set the table of jobs to be converted."""
         pass
 
-    def update_file_status(self, fpath: Path, status: FileStatus) -> None:
-        """Update the status of a file being converted."""
+    def update_file_status(self, job_id: int) -> None:
+        """Refresh a file whose status changed in the job table."""
         pass
 
     def stop(self) -> Optional[ReportType]: